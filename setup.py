@@ -1,11 +1,25 @@
 #!/usr/bin/env python3
+import asyncio
 import logging
 import os
-import platform
-import shutil
-import subprocess
+import stat
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+# sys.platform is fixed at interpreter build time, so unlike platform.system()
+# it needs neither an extra import nor a uname() call
+IS_WINDOWS = sys.platform == "win32"
+IS_MACOS = sys.platform == "darwin"
+
+
+def _init_logging() -> None:
+    """Configure the root logger once, however many managers are created"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+        )
 
 
 class DevEnvironmentManager:
@@ -17,218 +31,495 @@ class DevEnvironmentManager:
         is_windows: True if running on Windows
         is_macos: True if running on macOS
         logger: Logger instance
+        had_errors: True once any step has reported a failure
+        managed_links: Symlinks set up by this run, as target -> source
     """
 
-    def __init__(self, dotfiles_path: Optional[str] = None):
-        self.home = str(Path.home())
-        self.dotfiles_path = dotfiles_path or os.path.join(self.home, "dotfiles")
-        self.is_windows = platform.system() == "Windows"
-        self.is_macos = platform.system() == "Darwin"
+    BREW_PACKAGES = ["python3", "git", "visual-studio-code", "iterm2", "zsh"]
 
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    # Upper bound on child processes running at the same time
+    MAX_CONCURRENT_COMMANDS = 8
+
+    # Directories that never affect the installed configuration
+    STAMP_IGNORED_DIRS = {".git", "venv", "__pycache__"}
+
+    def __init__(self, dotfiles_path: Optional[Union[str, Path]] = None):
+        self.home = Path.home()
+        self.dotfiles_path = (
+            Path(dotfiles_path) if dotfiles_path else self.home / "dotfiles"
         )
+        self.is_windows = IS_WINDOWS
+        self.is_macos = IS_MACOS
+        self.stamp_path = self.home / ".cache" / "dotfiles" / "setup.stamp"
+        self.had_errors = False
+        self.managed_links: dict[str, str] = {}
+
+        _init_logging()
         self.logger = logging.getLogger(__name__)
+        self._brew_fetch_proc: Optional[asyncio.subprocess.Process] = None
+        self._command_slots: Optional[asyncio.Semaphore] = None
+
+    async def _exec(
+        self,
+        command: list[str],
+        input_data: Optional[bytes] = None,
+        capture_output: bool = False,
+    ) -> tuple[int, bytes, bytes]:
+        """Run a command on the event loop and return (returncode, stdout, stderr)
+
+        At most MAX_CONCURRENT_COMMANDS children run at once; stdout/stderr
+        are only captured when asked for and are otherwise inherited.
+        """
+        # Created lazily so the semaphore belongs to the running event loop
+        if self._command_slots is None:
+            self._command_slots = asyncio.Semaphore(self.MAX_CONCURRENT_COMMANDS)
+
+        pipe = asyncio.subprocess.PIPE if capture_output else None
+        async with self._command_slots:
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE if input_data is not None else None,
+                stdout=pipe,
+                stderr=pipe,
+            )
+            stdout, stderr = await proc.communicate(input_data)
+        return proc.returncode, stdout or b"", stderr or b""
 
-    def run_command(self, command: list[str]) -> bool:
+    async def run_command(self, command: list[str]) -> bool:
         """Run a shell command and handle errors"""
-        try:
-            subprocess.run(command, check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Command failed: {' '.join(command)}")
-            self.logger.error(f"Error: {str(e)}")
+        returncode, _, _ = await self._exec(command)
+        if returncode != 0:
+            self.had_errors = True
+            self.logger.error("Command failed: %s", " ".join(command))
+            self.logger.error("Error: exit status %d", returncode)
             return False
+        return True
 
-    def backup_existing_config(self, config_path: str) -> None:
-        """Backup existing configuration file if it exists"""
-        if os.path.exists(config_path):
-            backup_path = f"{config_path}.backup"
-            shutil.move(config_path, backup_path)
-            self.logger.info(f"Backed up existing config: {backup_path}")
+    async def run_remote_script(self, url: str, shell: str) -> bool:
+        """Download an install script and run it with the given shell
 
-    def create_symlink(self, source: str, target: str) -> None:
+        Equivalent to `shell -c "$(curl -fsSL url)"` without going through
+        an extra /bin/sh to expand the command substitution.
+        """
+        returncode, script, stderr = await self._exec(
+            ["curl", "-fsSL", url], capture_output=True
+        )
+        if returncode != 0:
+            self.had_errors = True
+            self.logger.error("Failed to download %s", url)
+            self.logger.error(
+                "Error: %s", stderr.decode().strip() or f"exit status {returncode}"
+            )
+            return False
+        return await self.run_command([shell, "-c", script.decode()])
+
+    @staticmethod
+    def _lstat(path: Path) -> Optional[os.stat_result]:
+        """Return lstat() of path, or None if nothing exists there"""
+        try:
+            return path.lstat()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _dir_ensured(path: Path) -> bool:
+        """Create a directory once per run; repeated calls are cache hits"""
+        path.mkdir(parents=True, exist_ok=True)
+        return True
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _which(name: str) -> Optional[str]:
+        """Look up an executable on PATH once per run
+
+        Clear the cache after installing new tools so they are picked up.
+        """
+        import shutil
+
+        return shutil.which(name)
+
+    def backup_existing_config(
+        self, config_path: Path, config_stat: Optional[os.stat_result] = None
+    ) -> None:
+        """Backup existing configuration file if it exists
+
+        Callers that have already lstat()-ed config_path can pass the result
+        as config_stat to skip a second lookup.
+        """
+        if config_stat is None:
+            config_stat = self._lstat(config_path)
+        if config_stat is not None:
+            # The backup is a sibling of the original, so a single rename
+            # suffices (and replaces any previous backup)
+            backup_path = config_path.with_name(f"{config_path.name}.backup")
+            config_path.replace(backup_path)
+            self.logger.info("Backed up existing config: %s", backup_path)
+
+    def create_symlink(self, source: Path, target: Path) -> None:
         """Create a symlink, handling both Windows and Unix systems"""
         try:
             # Ensure parent directory exists
-            os.makedirs(os.path.dirname(target), exist_ok=True)
-
-            # Remove existing symlink or file
-            if os.path.exists(target):
-                if os.path.islink(target):
-                    os.unlink(target)
+            self._dir_ensured(target.parent)
+
+            # Remove existing symlink or file, using a single lstat() to tell
+            # them apart (this also catches dangling symlinks)
+            target_stat = self._lstat(target)
+            if target_stat is not None:
+                if stat.S_ISLNK(target_stat.st_mode):
+                    # Nothing to do on re-runs where the link is already right
+                    if target.readlink() == source:
+                        self.logger.info("Symlink up to date: %s", target)
+                        self.managed_links[str(target)] = str(source)
+                        return
+                    target.unlink()
                 else:
-                    self.backup_existing_config(target)
+                    self.backup_existing_config(target, target_stat)
 
             # Create the symlink
             if self.is_windows:
-                if os.path.isdir(source):
-                    os.system(f'mklink /D "{target}" "{source}"')
-                else:
-                    os.system(f'mklink "{target}" "{source}"')
+                # Directory symlinks must be flagged explicitly on Windows
+                target.symlink_to(source, target_is_directory=source.is_dir())
             else:
-                os.symlink(source, target)
+                target.symlink_to(source)
 
-            self.logger.info(f"Created symlink: {target} -> {source}")
+            self.logger.info("Created symlink: %s -> %s", target, source)
+            self.managed_links[str(target)] = str(source)
         except Exception as e:
-            self.logger.error(f"Failed to create symlink: {str(e)}")
+            self.had_errors = True
+            self.logger.error("Failed to create symlink: %s", e)
+
+    async def prefetch_packages(self) -> None:
+        """Start downloading brew bottles in the background
+
+        The child process is started before this returns, so the download
+        really runs alongside the steps in between; install_packages waits
+        for it to finish.
+        """
+        if self.is_macos and self._which("brew"):
+            self.logger.info("Prefetching packages...")
+            self._brew_fetch_proc = await asyncio.create_subprocess_exec(
+                "brew", "fetch", "--deps", *self.BREW_PACKAGES
+            )
 
-    def install_packages(self) -> None:
+    async def install_packages(self) -> None:
         """Install necessary packages based on OS"""
         self.logger.info("Installing necessary packages...")
 
         if self.is_macos:
             # Check if Homebrew is installed
-            if not shutil.which("brew"):
+            if not self._which("brew"):
                 self.logger.info("Installing Homebrew...")
-                brew_install = '/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'
-                os.system(brew_install)
-
-            # Install packages
-            packages = ["python3", "git", "visual-studio-code", "iterm2", "zsh"]
-            for package in packages:
-                self.run_command(["brew", "install", package])
+                brew_install = "https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh"
+                await self.run_remote_script(brew_install, "/bin/bash")
+                self._which.cache_clear()
+
+            # Let a running prefetch finish so brew installs from its cache
+            if self._brew_fetch_proc is not None:
+                returncode = await self._brew_fetch_proc.wait()
+                self._brew_fetch_proc = None
+                if returncode != 0:
+                    # Not fatal: brew install downloads whatever is missing
+                    self.logger.error("Prefetch failed: exit status %d", returncode)
+
+            # Install packages in a single brew invocation so Homebrew can
+            # resolve and download them together
+            await self.run_command(["brew", "install", *self.BREW_PACKAGES])
+            self._which.cache_clear()
 
         elif self.is_windows:
             self.logger.info("Please ensure you have the following installed:")
             self.logger.info("1. Python (from python.org)")
             self.logger.info("2. Git (from git-scm.com)")
             self.logger.info("3. VS Code (from code.visualstudio.com)")
-            input("Press Enter when ready to continue...")
+            # Prompt off the event loop so background downloads keep going
+            await asyncio.to_thread(input, "Press Enter when ready to continue...")
 
-    def setup_vscode(self) -> None:
+    async def setup_vscode(self) -> None:
         """Setup VS Code configuration and extensions"""
         self.logger.info("Setting up VS Code...")
 
         # Determine VS Code config path
         if self.is_windows:
-            vscode_config_path = os.path.join(
-                self.home, "AppData", "Roaming", "Code", "User"
-            )
+            vscode_config_path = self.home / "AppData" / "Roaming" / "Code" / "User"
         else:
-            vscode_config_path = os.path.join(
-                self.home, "Library", "Application Support", "Code", "User"
+            vscode_config_path = (
+                self.home / "Library" / "Application Support" / "Code" / "User"
             )
 
         # Create symlinks for VS Code settings
-        settings_source = os.path.join(self.dotfiles_path, "vscode", "settings.json")
-        keybindings_source = os.path.join(
-            self.dotfiles_path, "vscode", "keybindings.json"
-        )
-        snippets_source = os.path.join(self.dotfiles_path, "vscode", "snippets")
+        vscode_dotfiles = self.dotfiles_path / "vscode"
+        settings_source = vscode_dotfiles / "settings.json"
+        keybindings_source = vscode_dotfiles / "keybindings.json"
+        snippets_source = vscode_dotfiles / "snippets"
 
-        self.create_symlink(
-            settings_source, os.path.join(vscode_config_path, "settings.json")
-        )
-        self.create_symlink(
-            keybindings_source, os.path.join(vscode_config_path, "keybindings.json")
-        )
-        self.create_symlink(
-            snippets_source, os.path.join(vscode_config_path, "snippets")
-        )
+        self.create_symlink(settings_source, vscode_config_path / "settings.json")
+        self.create_symlink(keybindings_source, vscode_config_path / "keybindings.json")
+        self.create_symlink(snippets_source, vscode_config_path / "snippets")
 
         # Install extensions
-        extensions_file = os.path.join(self.dotfiles_path, "vscode", "extensions.txt")
-        if os.path.exists(extensions_file):
-            with open(extensions_file) as f:
-                for ext in f:
-                    ext = ext.strip()
-                    if ext:
-                        self.run_command(["code", "--install-extension", ext])
-
-    def setup_python_env(self) -> None:
+        extensions_file = vscode_dotfiles / "extensions.txt"
+        if extensions_file.exists():
+            # dict.fromkeys drops duplicate entries while keeping file order,
+            # so each extension spawns at most one `code` process
+            lines = extensions_file.read_text().splitlines()
+            extensions = list(dict.fromkeys(ln.strip() for ln in lines if ln.strip()))
+            await self.install_vscode_extensions(extensions)
+
+    async def install_vscode_extensions(self, extensions: list[str]) -> bool:
+        """Install VS Code extensions concurrently
+
+        Each `code --install-extension` call is an independent process, so
+        they all run at once, bounded by MAX_CONCURRENT_COMMANDS.
+        """
+        if not extensions:
+            return True
+
+        if not self._which("code"):
+            self.had_errors = True
+            self.logger.error("VS Code CLI not found, skipping extension installs")
+            return False
+
+        results = await asyncio.gather(
+            *(
+                self.run_command(["code", "--install-extension", ext])
+                for ext in extensions
+            )
+        )
+        return all(results)
+
+    async def setup_python_env(self) -> None:
         """Setup Python environment and packages"""
         self.logger.info("Setting up Python environment...")
 
-        requirements_file = os.path.join(
-            self.dotfiles_path, "python", "requirements.txt"
-        )
-        if os.path.exists(requirements_file):
-            self.run_command(["pip", "install", "-r", requirements_file])
+        requirements_file = self.dotfiles_path / "python" / "requirements.txt"
+        venv_path = self.dotfiles_path / "python" / "venv"
+
+        # Installing requirements and creating the virtual environment touch
+        # independent paths, so run them side by side
+        commands = []
+        if requirements_file.exists():
+            commands.append(self.install_requirements(requirements_file))
 
         # Create and configure virtual environment if needed
-        venv_path = os.path.join(self.dotfiles_path, "python", "venv")
-        if not os.path.exists(venv_path):
-            self.run_command(["python", "-m", "venv", venv_path])
+        if not venv_path.exists():
+            commands.append(self.run_command(["python", "-m", "venv", str(venv_path)]))
+
+        await asyncio.gather(*commands)
+
+    async def install_requirements(self, requirements_file: Path) -> bool:
+        """Install Python requirements, preferring uv over pip when available"""
+        if self._which("uv"):
+            # Target the running interpreter, matching what plain pip would do
+            return await self.run_command(
+                [
+                    "uv",
+                    "pip",
+                    "install",
+                    "--python",
+                    sys.executable,
+                    "-r",
+                    str(requirements_file),
+                ]
+            )
+        return await self.run_command(["pip", "install", "-r", str(requirements_file)])
 
-    def setup_git(self):
+    async def setup_git(self):
         """Setup Git configuration"""
         self.logger.info("Setting up Git configuration...")
 
         # Setup main gitconfig
-        gitconfig_source = os.path.join(self.dotfiles_path, "git", ".gitconfig")
-        gitconfig_target = os.path.join(self.home, ".gitconfig")
+        gitconfig_source = self.dotfiles_path / "git" / ".gitconfig"
+        gitconfig_target = self.home / ".gitconfig"
 
         # Setup OS-specific config
         if self.is_windows:
-            os_config_source = os.path.join(
-                self.dotfiles_path, "git", ".gitconfig.windows"
-            )
+            os_config_source = self.dotfiles_path / "git" / ".gitconfig.windows"
         else:
-            os_config_source = os.path.join(
-                self.dotfiles_path, "git", ".gitconfig.macos"
-            )
+            os_config_source = self.dotfiles_path / "git" / ".gitconfig.macos"
 
-        os_config_target = os.path.join(self.home, ".gitconfig.os")
+        os_config_target = self.home / ".gitconfig.os"
 
         # Create the symlinks
         self.create_symlink(gitconfig_source, gitconfig_target)
         self.create_symlink(os_config_source, os_config_target)
 
-    def setup_zsh(self) -> None:
+    async def setup_zsh(self) -> None:
         """Setup Zsh and Oh My Zsh configuration"""
         if not self.is_windows:
             self.logger.info("Setting up Zsh configuration...")
 
             # Install Oh My Zsh if not already installed
-            omz_path = os.path.join(self.home, ".oh-my-zsh")
-            if not os.path.exists(omz_path):
-                omz_install = 'sh -c "$(curl -fsSL https://raw.githubusercontent.com/ohmyzsh/ohmyzsh/master/tools/install.sh)"'
-                os.system(omz_install)
+            omz_path = self.home / ".oh-my-zsh"
+            if not omz_path.exists():
+                omz_install = "https://raw.githubusercontent.com/ohmyzsh/ohmyzsh/master/tools/install.sh"
+                await self.run_remote_script(omz_install, "sh")
 
             # Setup Zsh configuration
-            zshrc_source = os.path.join(self.dotfiles_path, "zsh", ".zshrc")
-            zshrc_target = os.path.join(self.home, ".zshrc")
+            zshrc_source = self.dotfiles_path / "zsh" / ".zshrc"
+            zshrc_target = self.home / ".zshrc"
             self.create_symlink(zshrc_source, zshrc_target)
 
-    def setup_iterm(self) -> None:
+    async def setup_iterm(self) -> None:
         """Setup iTerm2 configuration"""
         if self.is_macos:
             self.logger.info("Setting up iTerm2 configuration...")
 
-            iterm_source = os.path.join(
-                self.dotfiles_path, "iterm2", "com.googlecode.iterm2.plist"
-            )
-            iterm_target = os.path.join(
-                self.home, "Library", "Preferences", "com.googlecode.iterm2.plist"
+            iterm_source = self.dotfiles_path / "iterm2" / "com.googlecode.iterm2.plist"
+            iterm_target = (
+                self.home / "Library" / "Preferences" / "com.googlecode.iterm2.plist"
             )
             self.create_symlink(iterm_source, iterm_target)
 
             # Load custom preferences
-            os.system(
-                f"defaults write com.googlecode.iterm2 LoadPrefsFromCustomFolder -bool true"
-            )
-            os.system(
-                f"defaults write com.googlecode.iterm2 PrefsCustomFolder -string {os.path.dirname(iterm_source)}"
+            await self.update_defaults(
+                "com.googlecode.iterm2",
+                {
+                    "LoadPrefsFromCustomFolder": True,
+                    "PrefsCustomFolder": str(iterm_source.parent),
+                },
             )
 
-    def setup_all(self) -> None:
-        """Run complete setup process"""
+    async def update_defaults(self, domain: str, values: dict) -> bool:
+        """Set several macOS defaults keys with a single plist rewrite
+
+        `defaults import` replaces the whole domain, so the current
+        preferences are exported first and the new keys merged into them.
+        """
+        import plistlib
+
+        returncode, exported, stderr = await self._exec(
+            ["defaults", "export", domain, "-"], capture_output=True
+        )
+        if returncode == 0:
+            try:
+                prefs = plistlib.loads(exported) if exported.strip() else {}
+                prefs.update(values)
+            except (plistlib.InvalidFileException, ValueError, AttributeError) as e:
+                returncode, stderr = -1, str(e).encode()
+            else:
+                returncode, _, stderr = await self._exec(
+                    ["defaults", "import", domain, "-"],
+                    input_data=plistlib.dumps(prefs),
+                    capture_output=True,
+                )
+
+        if returncode != 0:
+            self.had_errors = True
+            self.logger.error("Failed to update defaults for %s", domain)
+            self.logger.error("Error: %s", stderr.decode().strip())
+            return False
+        return True
+
+    def _dotfiles_fingerprint(self) -> Optional[str]:
+        """Return the newest mtime under the dotfiles directory
+
+        Directory mtimes are included so added or removed files count as a
+        change. Returns None if the dotfiles directory does not exist.
+        """
+        if not self.dotfiles_path.is_dir():
+            return None
+        newest = 0.0
+        for root, dirs, files in os.walk(self.dotfiles_path):
+            dirs[:] = [d for d in dirs if d not in self.STAMP_IGNORED_DIRS]
+            newest = max(newest, os.stat(root).st_mtime)
+            for name in files:
+                newest = max(newest, os.lstat(os.path.join(root, name)).st_mtime)
+        return f"{self.dotfiles_path}\n{newest!r}"
+
+    @staticmethod
+    def _links_intact(links: dict[str, str]) -> bool:
+        """Check that every recorded symlink still points at its source
+
+        Costs one readlink() per link, which is enough to notice targets
+        that were deleted or replaced by a regular file.
+        """
+        for target, source in links.items():
+            try:
+                if os.readlink(target) != source:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _read_stamp(self) -> Optional[dict]:
+        """Return the stamp recorded by the last successful run"""
+        import json
+
+        try:
+            stamp = json.loads(self.stamp_path.read_text())
+        except (OSError, ValueError):
+            return None
+        return stamp if isinstance(stamp, dict) else None
+
+    def _write_stamp(self, fingerprint: str) -> None:
+        """Record a successful run, replacing the stamp atomically
+
+        The stamp holds the dotfiles fingerprint and the symlinks created,
+        so the next run can tell whether either side has changed.
+        """
+        import json
+
+        stamp = {"fingerprint": fingerprint, "links": self.managed_links}
+        try:
+            self._dir_ensured(self.stamp_path.parent)
+            tmp_path = self.stamp_path.with_name(f"{self.stamp_path.name}.tmp")
+            tmp_path.write_text(json.dumps(stamp, indent=2))
+            tmp_path.replace(self.stamp_path)
+        except OSError as e:
+            self.logger.error("Failed to write setup stamp: %s", e)
+
+    async def setup_all(self, force: bool = False) -> None:
+        """Run complete setup process
+
+        Skips all work when the dotfiles are unchanged since the last
+        successful run and every symlink it created is still in place,
+        unless force is set.
+        """
+        fingerprint = self._dotfiles_fingerprint()
+        if not force and fingerprint is not None:
+            stamp = self._read_stamp()
+            if (
+                stamp is not None
+                and stamp.get("fingerprint") == fingerprint
+                and self._links_intact(stamp.get("links", {}))
+            ):
+                self.logger.info(
+                    "Development environment is up to date "
+                    "(set DOTFILES_FORCE=1 to rerun anyway)"
+                )
+                return
+
         self.logger.info("Starting development environment setup...")
 
         # Create dotfiles directory if it doesn't exist
-        os.makedirs(self.dotfiles_path, exist_ok=True)
+        self._dir_ensured(self.dotfiles_path)
 
-        # Run setup steps
-        # self.install_packages()
-        self.setup_git()
-        self.setup_vscode()
-        # self.setup_python_env()
+        # Download packages in the background while brew-independent steps run
+        # await self.prefetch_packages()
+        await self.setup_git()
 
+        # Packages must be in place before the other steps use brew/code/pip;
+        # this installs from brew's cache warmed by the prefetch
+        # await self.install_packages()
+
+        # The remaining steps touch disjoint paths, so run them concurrently
+        steps = [
+            self.setup_vscode,
+            # self.setup_python_env,
+        ]
         # if not self.is_windows:
-        #     self.setup_zsh()
-        #     self.setup_iterm()
+        #     steps += [self.setup_zsh, self.setup_iterm]
+
+        await asyncio.gather(*(step() for step in steps))
+
+        # Only remember runs that completed cleanly so failures are retried.
+        # The dotfiles are fingerprinted again here so files created during
+        # setup don't make the next run look stale
+        if not self.had_errors:
+            fingerprint = self._dotfiles_fingerprint()
+            if fingerprint is not None:
+                self._write_stamp(fingerprint)
 
         self.logger.info("Setup complete! 🎉")
 
@@ -240,18 +531,19 @@ class DevEnvironmentManager:
 def main():
     """Main entry point for script
     Reads the dotfiles path from the environment variable DOTFILES_PATH
-    or uses the default path ~/dotfiles
+    or uses the default path ~/dotfiles. Setting DOTFILES_FORCE to any value
+    other than "" or "0" reruns the setup even if the dotfiles are unchanged
+    since the last run
 
     Creates a DevEnvironmentManager instance and runs the setup process
     """
     # Get dotfiles path from environment variable or use default
-    dotfiles_path = os.getenv("DOTFILES_PATH") or os.path.join(
-        str(Path.home()), "dotfiles"
-    )
+    dotfiles_path = os.getenv("DOTFILES_PATH") or Path.home() / "dotfiles"
+    force = os.getenv("DOTFILES_FORCE", "") not in ("", "0")
 
     # Initialize and run setup
     manager = DevEnvironmentManager(dotfiles_path)
-    manager.setup_all()
+    asyncio.run(manager.setup_all(force=force))
 
 
 if __name__ == "__main__":